@@ -1,11 +1,34 @@
 from __future__ import annotations
 
 import argparse
+import gzip
+from collections import Counter, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+import itertools
 import json
+import mmap
+import multiprocessing
+import os
 from pathlib import Path
+import stat
+import sys
+import threading
+from typing import Any, ContextManager, Iterable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None
 
 from .csv_exporter import write_odds_csv_files
-from .scraper import NetkeibaScraper
+from .scraper import NetkeibaScraper, ScrapeOptions
+
+_msgspec_encoder = msgspec.json.Encoder() if msgspec is not None else None
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -15,40 +38,179 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--output", default="race_data.json", help="Output JSON path")
     parser.add_argument("--csv-dir", default=None, help="Directory to export bet-type CSV files")
     parser.add_argument("--batch-output-dir", default="out/batch", help="Output root directory for --url-file mode")
-    parser.add_argument("--indent", type=int, default=2, help="JSON indent")
+    parser.add_argument("--indent", type=int, default=0, help="JSON indent (0 = compact)")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Max simultaneous requests to netkeiba (also races in flight in --url-file mode)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Scrape in this many processes in --url-file mode (--concurrency is split across them)",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write the JSON output gzip-compressed (adds a .gz suffix)",
+    )
+    parser.add_argument(
+        "--keep-empty-csv",
+        action="store_true",
+        help="Also write empty CSV files for bet types without odds rows",
+    )
     return parser
 
 
+_worker_state = threading.local()
+# Set in --workers processes, which scrape their races on these threads.
+_worker_threads: ThreadPoolExecutor | None = None
+# Shared by every scraper, across worker processes, to enforce --concurrency.
+_request_limit = ScrapeOptions().max_concurrent_requests
+_request_slots: ContextManager[Any] | None = None
+
+
+def _limit_requests(limit: int, slots: ContextManager[Any] | None = None) -> None:
+    global _request_limit, _request_slots
+    _request_limit = limit
+    _request_slots = slots or threading.BoundedSemaphore(limit)
+
+
+def _init_process_worker(threads: int, limit: int, slots: ContextManager[Any]) -> None:
+    global _worker_threads
+    _limit_requests(limit, slots)
+    _worker_threads = ThreadPoolExecutor(max_workers=threads)
+
+
+def _scrape_in_worker(url: str) -> dict:
+    scraper = getattr(_worker_state, "scraper", None)
+    if scraper is None:
+        scraper = NetkeibaScraper(ScrapeOptions(max_concurrent_requests=_request_limit), _request_slots)
+        _worker_state.scraper = scraper
+    return scraper.scrape(url)
+
+
+def _scrape_outcome(url: str) -> tuple[dict | None, str | None]:
+    # Errors travel back as text; the exception itself may not pickle.
+    try:
+        return _scrape_in_worker(url), None
+    except Exception as exc:  # noqa: BLE001
+        return None, str(exc)
+
+
+def _scrape_urls_in_worker(urls: list[str]) -> list[tuple[dict | None, str | None]]:
+    if _worker_threads is None:
+        return [_scrape_outcome(url) for url in urls]
+    return list(_worker_threads.map(_scrape_outcome, urls))
+
+
 def _load_urls_from_file(url_file: str) -> list[str]:
-    lines = Path(url_file).read_text(encoding="utf-8").splitlines()
+    with open(url_file, "rb") as fp:
+        st = os.fstat(fp.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            # Pipes (--url-file /dev/stdin, process substitution) report size
+            # 0 and cannot be mapped; read them line by line.
+            return _collect_urls(fp)
+        # Map the file and decode line by line rather than materialising the
+        # whole manifest as one str plus a list of every line.
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return _collect_urls(iter(mm.readline, b""))
+
+
+def _collect_urls(lines: Iterable[bytes]) -> list[str]:
     urls = []
     for line in lines:
-        value = line.strip()
+        value = line.decode("utf-8").strip()
         if not value or value.startswith("#"):
             continue
         urls.append(value)
     return urls
 
 
-def _write_single_result(result: dict, output_path: Path, csv_dir: Path | None, indent: int) -> None:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(
-        json.dumps(result, ensure_ascii=False, indent=indent),
-        encoding="utf-8",
-    )
-    print(f"saved: {output_path}")
+def _encode_json_fast(obj: dict, indent: int) -> bytes | None:
+    if orjson is not None and indent in (0, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if _msgspec_encoder is not None:
+        data = _msgspec_encoder.encode(obj)
+        return msgspec.json.format(data, indent=indent) if indent else data
+    return None
+
+
+def _write_json(obj: dict, output_path: Path, indent: int, compress: bool = False) -> None:
+    data = _encode_json_fast(obj, indent)
+    if data is not None:
+        output_path.write_bytes(gzip.compress(data, compresslevel=1) if compress else data)
+        return
+    # json.dump streams encoded chunks into the file instead of building the
+    # whole document as one str first.
+    if compress:
+        fp_context = gzip.open(output_path, "wt", compresslevel=1, encoding="utf-8")
+    else:
+        fp_context = output_path.open("w", encoding="utf-8", buffering=1 << 16)
+    with fp_context as fp:
+        if indent:
+            json.dump(obj, fp, ensure_ascii=False, indent=indent)
+        else:
+            json.dump(obj, fp, ensure_ascii=False, separators=(",", ":"))
+
 
+def _ensure_dir(path: Path, ensured_dirs: set[Path] | None) -> None:
+    if ensured_dirs is not None and path in ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    if ensured_dirs is not None:
+        ensured_dirs.add(path)
+        ensured_dirs.update(path.parents)
+
+
+def _write_single_result(
+    result: dict,
+    output_path: Path,
+    csv_dir: Path | None,
+    indent: int,
+    ensured_dirs: set[Path] | None = None,
+    compress: bool = False,
+    keep_empty_csv: bool = False,
+) -> list[str]:
+    # Create the deeper CSV directory first so the JSON parent is usually
+    # already known to exist.
     if csv_dir:
-        written_files = write_odds_csv_files(result.get("odds", {}), csv_dir)
+        _ensure_dir(csv_dir, ensured_dirs)
+    _ensure_dir(output_path.parent, ensured_dirs)
+    if compress:
+        output_path = output_path.with_suffix(output_path.suffix + ".gz")
+    _write_json(result, output_path, indent, compress)
+    messages = [f"saved: {output_path}"]
+
+    if csv_dir:
+        written_files = write_odds_csv_files(
+            result.get("odds", {}),
+            csv_dir,
+            ensured_dirs=ensured_dirs,
+            skip_empty=not keep_empty_csv,
+        )
         for file_path in written_files:
-            print(f"saved: {file_path}")
+            messages.append(f"saved: {file_path}")
 
     odds_status = result.get("odds_status", {})
     for bet_type, status in odds_status.items():
         status_value = status.get("status", "unknown") if isinstance(status, dict) else "unknown"
         rows = status.get("rows", 0) if isinstance(status, dict) else 0
         message = status.get("message", "") if isinstance(status, dict) else ""
-        print(f"odds_status[{bet_type}]: {status_value} rows={rows} {message}")
+        messages.append(f"odds_status[{bet_type}]: {status_value} rows={rows} {message}")
+    return messages
+
+
+def _print_messages(messages: list[str]) -> None:
+    if messages:
+        sys.stdout.write("\n".join(messages) + "\n")
 
 
 def main() -> None:
@@ -59,13 +221,24 @@ def main() -> None:
         parser.error("--url または --url-file のどちらかを指定してください")
     if args.url and args.url_file:
         parser.error("--url と --url-file は同時に指定できません")
-
-    scraper = NetkeibaScraper()
+    if args.concurrency < 1:
+        parser.error("--concurrency は1以上を指定してください")
+    if args.workers < 1:
+        parser.error("--workers は1以上を指定してください")
 
     if args.url:
-        result = scraper.scrape(args.url)
+        result = NetkeibaScraper(ScrapeOptions(max_concurrent_requests=args.concurrency)).scrape(args.url)
         csv_dir = Path(args.csv_dir) if args.csv_dir else None
-        _write_single_result(result, Path(args.output), csv_dir, args.indent)
+        _print_messages(
+            _write_single_result(
+                result,
+                Path(args.output),
+                csv_dir,
+                args.indent,
+                compress=args.compress,
+                keep_empty_csv=args.keep_empty_csv,
+            )
+        )
         return
 
     urls = _load_urls_from_file(args.url_file)
@@ -73,20 +246,91 @@ def main() -> None:
         parser.error("--url-file に有効なURLがありません")
 
     batch_root = Path(args.batch_output_dir)
-    batch_root.mkdir(parents=True, exist_ok=True)
-    seen_race_ids: dict[str, int] = {}
-
-    for index, url in enumerate(urls, start=1):
-        result = scraper.scrape(url)
-        race_id_base = str(result.get("race_id") or f"race_{index:03d}")
-        seen_race_ids[race_id_base] = seen_race_ids.get(race_id_base, 0) + 1
-        suffix = seen_race_ids[race_id_base]
-        race_id = race_id_base if suffix == 1 else f"{race_id_base}_{suffix:02d}"
-
-        race_dir = batch_root / race_id
-        output_path = race_dir / "race_data.json"
-        csv_dir = race_dir / "csv"
-        _write_single_result(result, output_path, csv_dir, args.indent)
+    ensured_dirs: set[Path] = set()
+    _ensure_dir(batch_root, ensured_dirs)
+    seen_race_ids: Counter[str] = Counter()
+
+    # A bounded window of jobs is in flight; results are taken in input order.
+    pending_writes: deque[Future[list[str]]] = deque()
+    pending_scrapes: deque[tuple[list[tuple[int, str]], Future[list[tuple[dict | None, str | None]]]]] = deque()
+    queued_urls = iter(enumerate(urls, start=1))
+    failures = 0
+    executor: Executor
+    if args.workers > 1:
+        threads_per_worker = -(-args.concurrency // args.workers)
+        executor = ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_process_worker,
+            initargs=(threads_per_worker, args.concurrency, multiprocessing.BoundedSemaphore(args.concurrency)),
+        )
+        # One spare job per process so none idles while the head is awaited.
+        job_size = threads_per_worker
+        window = args.workers * 2
+    else:
+        _limit_requests(args.concurrency)
+        executor = ThreadPoolExecutor(max_workers=args.concurrency)
+        job_size = 1
+        window = args.concurrency
+
+    def fill_window() -> None:
+        while len(pending_scrapes) < window:
+            job = list(itertools.islice(queued_urls, job_size))
+            if not job:
+                return
+            pending_scrapes.append((job, executor.submit(_scrape_urls_in_worker, [url for _, url in job])))
+
+    with executor, ThreadPoolExecutor(max_workers=4) as writer:
+        try:
+            fill_window()
+            while pending_scrapes:
+                job, future = pending_scrapes.popleft()
+                try:
+                    outcomes = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    outcomes = [(None, str(exc))] * len(job)
+                del future
+                fill_window()
+
+                for (index, url), (result, error) in zip(job, outcomes):
+                    if result is None:
+                        failures += 1
+                        print(f"failed: {url} ({error})", file=sys.stderr)
+                        continue
+
+                    race_id_base = str(result.get("race_id") or f"race_{index:03d}")
+                    seen_race_ids[race_id_base] += 1
+                    suffix = seen_race_ids[race_id_base]
+                    race_id = race_id_base if suffix == 1 else f"{race_id_base}_{suffix:02d}"
+
+                    race_dir = os.path.join(batch_root, race_id)
+                    output_path = Path(race_dir, "race_data.json")
+                    csv_dir = Path(race_dir, "csv")
+                    pending_writes.append(
+                        writer.submit(
+                            _write_single_result,
+                            result,
+                            output_path,
+                            csv_dir,
+                            args.indent,
+                            ensured_dirs,
+                            compress=args.compress,
+                            keep_empty_csv=args.keep_empty_csv,
+                        )
+                    )
+                del outcomes, result
+                while pending_writes and pending_writes[0].done():
+                    _print_messages(pending_writes.popleft().result())
+
+            while pending_writes:
+                _print_messages(pending_writes.popleft().result())
+        except BaseException:
+            # Drop queued scrapes rather than letting the executor drain them.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    if failures:
+        print(f"failed: {failures}/{len(urls)} URLs", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import csv
+from functools import lru_cache
+import io
 from pathlib import Path
+import threading
 
 
 CSV_FILE_ALIASES = {
@@ -15,41 +18,77 @@ CSV_FILE_ALIASES = {
     "三連単": "trifecta",
 }
 
+# Per-thread scratch buffer reused by the csv.writer fallback; CSVs may be
+# written from several writer threads at once in batch mode.
+_scratch = threading.local()
 
+
+@lru_cache(maxsize=64)
 def _safe_file_name(name: str) -> str:
-    if name in CSV_FILE_ALIASES:
-        return CSV_FILE_ALIASES[name]
-    return name.replace("/", "_").replace(" ", "_").lower()
+    return CSV_FILE_ALIASES.get(name) or name.replace("/", "_").replace(" ", "_").lower()
+
+
+def _render_csv(fieldnames: list[str], rows: list[dict[str, str]]) -> str:
+    records = [fieldnames, *([row.get(key, "") for key in fieldnames] for row in rows)]
+
+    # Odds tables are almost always plain numbers and names, which need no
+    # quoting; join them directly and only fall back to csv.writer otherwise.
+    if len(fieldnames) > 1:
+        lines: list[str] = []
+        try:
+            for record in records:
+                line = ",".join(record)
+                if line.count(",") != len(record) - 1 or '"' in line or "\r" in line or "\n" in line:
+                    break
+                lines.append(line)
+            else:
+                lines.append("")
+                return "\r\n".join(lines)
+        except TypeError:
+            pass
 
+    buffer = getattr(_scratch, "buffer", None)
+    if buffer is None:
+        buffer = io.StringIO()
+        _scratch.buffer = buffer
+    buffer.seek(0)
+    buffer.truncate()
+    csv.writer(buffer).writerows(records)
+    return buffer.getvalue()
 
-def write_odds_csv_files(odds_data: dict[str, list[dict[str, str]]], output_dir: Path) -> list[Path]:
-    output_dir.mkdir(parents=True, exist_ok=True)
+
+def write_odds_csv_files(
+    odds_data: dict[str, list[dict[str, str]]],
+    output_dir: Path,
+    ensured_dirs: set[Path] | None = None,
+    skip_empty: bool = True,
+) -> list[Path]:
+    if ensured_dirs is None or output_dir not in ensured_dirs:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        if ensured_dirs is not None:
+            ensured_dirs.add(output_dir)
     written_files: list[Path] = []
 
     for bet_type, rows in odds_data.items():
         if not isinstance(rows, list):
             continue
 
+        if not rows and skip_empty:
+            continue
+
         file_path = output_dir / f"{_safe_file_name(bet_type)}.csv"
 
         if not rows:
-            file_path.write_text("", encoding="utf-8")
+            file_path.write_bytes(b"")
             written_files.append(file_path)
             continue
 
-        fieldnames: list[str] = []
-        seen: set[str] = set()
+        merged: dict[str, str] = {}
         for row in rows:
-            for key in row.keys():
-                if key not in seen:
-                    seen.add(key)
-                    fieldnames.append(key)
-
-        with file_path.open("w", encoding="utf-8", newline="") as fp:
-            writer = csv.DictWriter(fp, fieldnames=fieldnames)
-            writer.writeheader()
-            for row in rows:
-                writer.writerow(row)
+            merged.update(row)
+        fieldnames = list(merged)
+
+        file_path.write_bytes(_render_csv(fieldnames, rows).encode("utf-8"))
 
         written_files.append(file_path)
 
@@ -1,15 +1,39 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 import json
+from operator import itemgetter
 import re
-from typing import Any
+import sys
+import threading
+from typing import Any, Callable, ContextManager, Iterable, Iterator, TypeVar
 from urllib.parse import parse_qs, urljoin, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # pragma: no cover - optional speedup
+    try:
+        # selectolax < 1.0 only ships the Modest backend under this name.
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+
+_T = TypeVar("_T")
 
 BET_TYPES = ["単勝", "複勝", "枠連", "馬連", "ワイド", "馬単", "三連複", "三連単"]
 ODDS_TYPE_MAP = {
@@ -32,11 +56,24 @@ API_ODDS_TYPE_MAP = {
     "三連複": "7",
     "三連単": "8",
 }
+BET_TYPE_RE = re.compile("|".join(map(re.escape, BET_TYPES)))
+CART_ITEM_NUMBER_RE = re.compile(r"_(\d+)")
+NUMERIC_ODDS_RE = re.compile(r"^\+?[\d,]*\d(?:\.\d+)?$")
+ODDS_RANGE_RE = re.compile(r"^\s*([0-9]+(?:\.[0-9]+)?)\s*-\s*([0-9]+(?:\.[0-9]+)?)\s*$")
+NON_DIGIT_RE = re.compile(r"\D+")
+META_CHARSET_RE = re.compile(rb"<meta[^>]+charset=[\"']?([A-Za-z0-9_-]+)", re.IGNORECASE)
 
 
 @dataclass
 class ScrapeOptions:
     timeout: int = 20
+    max_workers: int = 8
+    jiku_workers: int = 6
+    pool_size: int = 20
+    # Requests on the wire at once, across every fetch thread of a scrape.
+    max_concurrent_requests: int = 10
+    max_retries: int = 3
+    retry_backoff: float = 0.3
     user_agent: str = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
@@ -44,9 +81,39 @@ class ScrapeOptions:
 
 
 class NetkeibaScraper:
-    def __init__(self, options: ScrapeOptions | None = None) -> None:
+    def __init__(
+        self,
+        options: ScrapeOptions | None = None,
+        request_slots: ContextManager[Any] | None = None,
+    ) -> None:
         self.options = options or ScrapeOptions()
+        # Scrapers given the same semaphore, even across processes, share its limit.
+        self._request_slots = request_slots or threading.BoundedSemaphore(self.options.max_concurrent_requests)
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(self.options.pool_size, self.options.max_concurrent_requests),
+            max_retries=Retry(
+                total=self.options.max_retries,
+                backoff_factor=self.options.retry_backoff,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("GET",),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Responses are memoized for the duration of one scrape() call so
+        # fallbacks and status probes do not repeat a request. Pages are cached
+        # as futures so concurrent bet types asking for the same URL (単勝 and
+        # 複勝 share one page) wait on a single in-flight request.
+        self._html_cache: dict[str, Future[str]] = {}
+        self._html_cache_lock = threading.Lock()
+        self._api_cache: dict[tuple[str, str], dict[str, Any] | None] = {}
+        self._speculative_executor: Executor | None = None
+        # Accept-Encoding is left to requests: it already offers gzip/deflate,
+        # plus br when the optional brotli package is installed. Advertising
+        # br without a decoder would leave compressed bodies undecodable.
         self.session.headers.update(
             {
                 "User-Agent": self.options.user_agent,
@@ -55,26 +122,52 @@ class NetkeibaScraper:
         )
 
     def scrape(self, race_url: str) -> dict[str, Any]:
-        html = self._fetch_html(race_url)
-        soup = BeautifulSoup(html, "lxml")
-
+        self._html_cache = {}
+        self._api_cache = {}
         race_id = self._extract_race_id(race_url)
         race_date = self._extract_race_date(race_id)
-        race_name = self._extract_race_name(soup)
-        entries = self._extract_race_entries(soup)
-        odds_links = self._discover_odds_links(soup, race_url)
-        all_urls = dict(odds_links)
 
         odds: dict[str, Any] = {bet_type: [] for bet_type in BET_TYPES}
         odds_status: dict[str, Any] = {}
 
-        for bet_type in BET_TYPES:
+        # Own pool so fallback fetches never queue behind the tasks waiting on them.
+        speculative = ThreadPoolExecutor(max_workers=len(BET_TYPES))
+        self._speculative_executor = speculative
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.options.max_workers) as executor:
+                # The race id comes from the URL, so the API calls need not wait for the race page.
+                api_payloads = self._prefetch_api_payloads(executor, race_id)
+
+                html = self._fetch_html(race_url)
+                soup = BeautifulSoup(html, "lxml")
+                race_name, entries, odds_links = self._analyze_index_soup(soup, race_url)
+                horse_name_by_no = self._build_horse_lookup(entries)
+                all_urls = dict(odds_links)
+
+                futures = {
+                    bet_type: executor.submit(
+                        self._collect_bet_type,
+                        race_id,
+                        bet_type,
+                        entries,
+                        race_date,
+                        api_payloads.get(bet_type),
+                        horse_name_by_no,
+                    )
+                    for bet_type in BET_TYPES
+                }
+        finally:
+            self._speculative_executor = None
+            speculative.shutdown(wait=True, cancel_futures=True)
+
+        for bet_type, future in futures.items():
             try:
-                rows, urls = self._collect_full_odds_for_bet_type(race_id, bet_type, entries)
+                rows, urls, status = future.result()
                 odds[bet_type] = rows
                 for key, value in urls.items():
                     all_urls.setdefault(key, value)
-                odds_status[bet_type] = self._build_odds_status(bet_type, rows, urls, race_date)
+                odds_status[bet_type] = status
             except Exception as exc:  # noqa: BLE001
                 failed_url = self._build_odds_type_url(race_id, bet_type) or self._build_abroad_type_url(race_id, bet_type)
                 odds[bet_type] = [{"error": str(exc), "source_url": failed_url or ""}]
@@ -85,6 +178,8 @@ class NetkeibaScraper:
                     "source_url": failed_url,
                 }
 
+        self._html_cache = {}
+        self._api_cache = {}
         return {
             "race_url": race_url,
             "race_id": race_id,
@@ -96,17 +191,64 @@ class NetkeibaScraper:
             "odds_links": all_urls,
         }
 
+    def scrape_columnar(self, race_url: str) -> dict[str, Any]:
+        # Same result as scrape(), with the entry and odds tables turned into
+        # {column: [values...]} so callers aggregating a column (e.g. min odds)
+        # read one list instead of a key lookup on every row dict.
+        result = self.scrape(race_url)
+        result["entries"] = self.rows_to_columns(result["entries"])
+        result["odds"] = {bet_type: self.rows_to_columns(rows) for bet_type, rows in result["odds"].items()}
+        return result
+
+    @staticmethod
+    def rows_to_columns(rows: list[dict[str, str]]) -> dict[str, list[str]]:
+        # Columns follow first appearance across rows, as the CSV header does;
+        # cells missing from a row are filled with "" so columns stay aligned.
+        fieldnames: dict[str, None] = {}
+        for row in rows:
+            fieldnames.update(dict.fromkeys(row))
+        return {key: [row.get(key, "") for row in rows] for key in fieldnames}
+
+    def _prefetch_api_payloads(
+        self,
+        executor: Executor,
+        race_id: str | None,
+    ) -> dict[str, Future[dict[str, Any] | None]]:
+        if not race_id:
+            return {}
+        payloads: dict[str, Future[dict[str, Any] | None]] = {}
+        for bet_type in BET_TYPES:
+            api_type = API_ODDS_TYPE_MAP.get(bet_type)
+            if not api_type:
+                continue
+            referer_url = self._build_odds_type_url(race_id, bet_type) or self._build_abroad_type_url(race_id, bet_type)
+            payloads[bet_type] = executor.submit(self._fetch_jra_odds_payload, race_id, api_type, referer_url)
+        return payloads
+
+    def _collect_bet_type(
+        self,
+        race_id: str | None,
+        bet_type: str,
+        entries: list[dict[str, str]],
+        race_date: str | None,
+        api_payload: Future[dict[str, Any] | None] | None = None,
+        horse_name_by_no: dict[str, str] | None = None,
+    ) -> tuple[list[dict[str, str]], dict[str, str], dict[str, Any]]:
+        rows, urls = self._collect_full_odds_for_bet_type(race_id, bet_type, entries, api_payload, horse_name_by_no)
+        return rows, urls, self._build_odds_status(bet_type, rows, urls, race_date, api_payload)
+
     def _build_odds_status(
         self,
         bet_type: str,
         rows: list[dict[str, str]],
         urls: dict[str, str],
         race_date: str | None,
+        api_payload: Future[dict[str, Any] | None] | None = None,
     ) -> dict[str, Any]:
         source_url = urls.get(bet_type)
         race_date_hint = self._build_future_race_hint(race_date)
         if not rows:
-            api_reason = self._fetch_jra_odds_reason(source_url, bet_type)
+            api_reason = self._fetch_jra_odds_reason(source_url, bet_type, api_payload)
             message = f"{bet_type}のオッズを取得できませんでした"
             if api_reason:
                 message = f"{message} (api_reason: {api_reason})"
@@ -128,7 +270,7 @@ class NetkeibaScraper:
                 "source_url": source_url,
             }
 
-        api_reason = self._fetch_jra_odds_reason(source_url, bet_type)
+        api_reason = self._fetch_jra_odds_reason(source_url, bet_type, api_payload)
         message = f"{bet_type}は発売前または未更新の可能性があります"
         if api_reason:
             message = f"{message} (api_reason: {api_reason})"
@@ -142,10 +284,11 @@ class NetkeibaScraper:
         }
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def _extract_race_date(race_id: str | None) -> str | None:
         if not race_id:
             return None
-        digits = "".join(ch for ch in race_id if ch.isdigit())
+        digits = NON_DIGIT_RE.sub("", race_id)
         if len(digits) < 8:
             return None
         yyyymmdd = digits[:8]
@@ -168,7 +311,12 @@ class NetkeibaScraper:
             return None
         return None
 
-    def _fetch_jra_odds_reason(self, source_url: str | None, bet_type: str) -> str | None:
+    def _fetch_jra_odds_reason(
+        self,
+        source_url: str | None,
+        bet_type: str,
+        api_payload: Future[dict[str, Any] | None] | None = None,
+    ) -> str | None:
         race_id = self._extract_race_id(source_url or "")
         if not race_id:
             return None
@@ -176,7 +324,12 @@ class NetkeibaScraper:
         if not odds_type:
             return None
         try:
-            payload = self._fetch_jra_odds_payload(race_id, odds_type, source_url)
+            # Reuse the payload prefetched for this bet type rather than asking
+            # the API a second time; a failed prefetch is not retried here.
+            if api_payload is not None:
+                payload = api_payload.result()
+            else:
+                payload = self._fetch_jra_odds_payload(race_id, odds_type, source_url)
             if not isinstance(payload, dict):
                 return None
             data = payload.get("data")
@@ -200,31 +353,47 @@ class NetkeibaScraper:
         api_odds_type: str,
         referer_url: str | None,
     ) -> dict[str, Any] | None:
+        cache_key = (race_id, api_odds_type)
+        if cache_key in self._api_cache:
+            return self._api_cache[cache_key]
+
         api_url = "https://race.netkeiba.com/api/api_get_jra_odds.html"
-        response = self.session.get(
-            api_url,
-            params={
-                "pid": "api_get_jra_odds",
-                "input": "UTF-8",
-                "output": "json",
-                "race_id": race_id,
-                "type": api_odds_type,
-                "action": "init",
-                "sort": "odds",
-                "compress": "0",
-            },
-            headers={"Referer": referer_url or ""},
-            timeout=self.options.timeout,
-        )
+        with self._request_slots:
+            response = self.session.get(
+                api_url,
+                params={
+                    "pid": "api_get_jra_odds",
+                    "input": "UTF-8",
+                    "output": "json",
+                    "race_id": race_id,
+                    "type": api_odds_type,
+                    "action": "init",
+                    "sort": "odds",
+                    "compress": "0",
+                },
+                headers={"Referer": referer_url or ""},
+                timeout=self.options.timeout,
+            )
         response.raise_for_status()
-        payload = json.loads(response.text)
-        return payload if isinstance(payload, dict) else None
+        if orjson is not None:
+            # Decode the UTF-8 body directly; only go through response.text if
+            # the bytes are not valid JSON as-is.
+            try:
+                payload = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                payload = json.loads(response.text)
+        else:
+            payload = json.loads(response.text)
+        result = payload if isinstance(payload, dict) else None
+        self._api_cache[cache_key] = result
+        return result
 
     def _extract_odds_rows_from_api_payload(
         self,
         payload: dict[str, Any],
         bet_type: str,
         entries: list[dict[str, str]],
+        horse_name_by_no: dict[str, str] | None = None,
     ) -> list[dict[str, str]]:
         api_type = API_ODDS_TYPE_MAP.get(bet_type)
         if not api_type:
@@ -240,33 +409,34 @@ class NetkeibaScraper:
         if not isinstance(typed_odds, dict) or not typed_odds:
             return []
 
-        horse_name_by_no: dict[str, str] = {}
-        for row in entries:
-            no = self._extract_horse_number_from_entry_row(row)
-            if no.isdigit():
-                horse_name_by_no[no] = self._extract_horse_name_from_entry_row(row)
+        if horse_name_by_no is None:
+            horse_name_by_no = self._build_horse_lookup(entries)
 
-        rows: list[dict[str, str]] = []
+        # Rows are decorated with their sort key as they are built, so the key
+        # is computed once per row from the already-parsed numbers.
+        decorated: list[tuple[Any, dict[str, str]]] = []
 
         if bet_type in {"単勝", "複勝"}:
+            with_range = bet_type == "複勝"
             for horse_no_key, values in typed_odds.items():
                 horse_no = str(int(horse_no_key)) if str(horse_no_key).isdigit() else str(horse_no_key)
                 if not isinstance(values, list) or not values:
                     continue
-                odds_value = str(values[0]).strip() if values[0] is not None else ""
-                if bet_type == "複勝" and len(values) >= 2 and values[1] is not None and str(values[1]).strip() not in {"", "0"}:
-                    odds_value = f"{str(values[0]).strip()} - {str(values[1]).strip()}"
-                rows.append(
-                    {
-                        "馬番": horse_no,
-                        "馬名": horse_name_by_no.get(horse_no, ""),
-                        "オッズ": self._normalize_odds_value(odds_value),
-                    }
+                decorated.append(
+                    (
+                        int(horse_no) if horse_no.isdigit() else 9999,
+                        {
+                            "馬番": horse_no,
+                            "馬名": horse_name_by_no.get(horse_no, ""),
+                            "オッズ": self._format_api_odds(values, with_range),
+                        },
+                    )
                 )
-            rows.sort(key=lambda row: int(row.get("馬番", "9999")) if row.get("馬番", "").isdigit() else 9999)
-            return rows
+            decorated.sort(key=itemgetter(0))
+            return [row for _, row in decorated]
 
         combo_size = 3 if bet_type in {"三連複", "三連単"} else 2
+        with_range = bet_type == "ワイド"
         for combo_key, values in typed_odds.items():
             if not isinstance(values, list) or not values:
                 continue
@@ -274,19 +444,31 @@ class NetkeibaScraper:
             parts = [combo_str[i : i + 2] for i in range(0, len(combo_str), 2)]
             if len(parts) != combo_size or not all(part.isdigit() for part in parts):
                 continue
-            combo = "-".join(str(int(part)) for part in parts)
-            odds_value = str(values[0]).strip() if values[0] is not None else ""
-            if bet_type == "ワイド" and len(values) >= 2 and values[1] is not None and str(values[1]).strip() not in {"", "0"}:
-                odds_value = f"{str(values[0]).strip()} - {str(values[1]).strip()}"
-            rows.append(
-                {
-                    "組み合わせ": combo,
-                    "オッズ": self._normalize_odds_value(odds_value),
-                }
+            numbers = tuple(int(part) for part in parts)
+            combo = "-".join(str(number) for number in numbers)
+            decorated.append(
+                (
+                    numbers,
+                    {
+                        "組み合わせ": combo,
+                        "オッズ": self._format_api_odds(values, with_range),
+                    },
+                )
             )
 
-        rows.sort(key=lambda row: self._combo_sort_key(row.get("組み合わせ", "")))
-        return rows
+        decorated.sort(key=itemgetter(0))
+        return [row for _, row in decorated]
+
+    @staticmethod
+    def _format_api_odds(values: list[Any], with_range: bool) -> str:
+        # API values are normalized once here: stringified, comma-free and
+        # stripped, with place/wide ranges joined as "low - high".
+        low = "" if values[0] is None else str(values[0]).replace(",", "").strip()
+        if with_range and len(values) >= 2 and values[1] is not None:
+            high = str(values[1]).replace(",", "").strip()
+            if high not in {"", "0"}:
+                return f"{low} - {high}".strip()
+        return low
 
     @staticmethod
     def _parse_numeric_odds(value: str) -> float | None:
@@ -306,15 +488,19 @@ class NetkeibaScraper:
         text = str(value).strip()
         if not text or text in {"-", "--", "---.-"}:
             return False
-        if NetkeibaScraper._parse_numeric_odds(text) is not None:
+        # Plain decimals and "low - high" ranges cover nearly every row; only
+        # fall back to the float() parse for anything else.
+        if NUMERIC_ODDS_RE.match(text) or ODDS_RANGE_RE.match(text):
             return True
-        return bool(re.match(r"^\s*([0-9]+(?:\.[0-9]+)?)\s*-\s*([0-9]+(?:\.[0-9]+)?)\s*$", text))
+        return NetkeibaScraper._parse_numeric_odds(text) is not None
 
     def _collect_full_odds_for_bet_type(
         self,
         race_id: str | None,
         bet_type: str,
         entries: list[dict[str, str]],
+        api_payload: Future[dict[str, Any] | None] | None = None,
+        horse_name_by_no: dict[str, str] | None = None,
     ) -> tuple[list[dict[str, str]], dict[str, str]]:
         urls: dict[str, str] = {}
 
@@ -331,31 +517,35 @@ class NetkeibaScraper:
             api_type = API_ODDS_TYPE_MAP.get(bet_type)
             if api_type:
                 try:
-                    payload = self._fetch_jra_odds_payload(race_id, api_type, primary_url)
-                    api_rows = self._extract_odds_rows_from_api_payload(payload or {}, bet_type, entries)
+                    if api_payload is not None:
+                        payload = api_payload.result()
+                    else:
+                        payload = self._fetch_jra_odds_payload(race_id, api_type, primary_url)
+                    api_rows = self._extract_odds_rows_from_api_payload(
+                        payload or {},
+                        bet_type,
+                        entries,
+                        horse_name_by_no,
+                    )
                     if api_rows:
                         urls[f"{bet_type}_api"] = "https://race.netkeiba.com/api/api_get_jra_odds.html"
                         return api_rows, urls
                 except Exception:  # noqa: BLE001
                     pass
 
+        # The API had nothing, so the odds come from HTML. Request the abroad
+        # fallback page alongside the primary one so an empty primary page
+        # does not cost another full round-trip.
+        fallback_html: Future[str] | None = None
+        if abroad_url and abroad_url != primary_url and bet_type not in {"三連複", "三連単"}:
+            fallback_html = self._fetch_speculatively(abroad_url)
+
         if bet_type in {"単勝", "複勝"}:
-            html = self._fetch_html(primary_url)
-            soup = BeautifulSoup(html, "lxml")
-            extracted = self._extract_odds_by_bet_type(soup)
-            rows = extracted.get(bet_type, [])
-            if not rows:
-                fallback = self._extract_win_place_by_table_position(soup)
-                rows = fallback.get(bet_type, [])
+            rows = self._extract_win_place_rows(self._fetch_html(primary_url), bet_type)
             if rows:
                 return rows, urls
-            if abroad_url and abroad_url != primary_url:
-                fallback_html = self._fetch_html(abroad_url)
-                fallback_soup = BeautifulSoup(fallback_html, "lxml")
-                fallback_extracted = self._extract_odds_by_bet_type(fallback_soup)
-                fallback_rows = fallback_extracted.get(bet_type, [])
-                if not fallback_rows:
-                    fallback_rows = self._extract_win_place_by_table_position(fallback_soup).get(bet_type, [])
+            if fallback_html is not None:
+                fallback_rows = self._extract_win_place_rows(fallback_html.result(), bet_type)
                 if fallback_rows:
                     urls[f"{bet_type}_fallback"] = abroad_url
                     return fallback_rows, urls
@@ -376,14 +566,11 @@ class NetkeibaScraper:
             return rows, urls
 
         html = self._fetch_html(primary_url)
-        soup = BeautifulSoup(html, "lxml")
-        rows = self._extract_cart_items(soup, bet_type)
+        rows = self._extract_cart_items_from_html(html, bet_type)
         if rows:
             return rows, urls
-        if abroad_url and abroad_url != primary_url:
-            fallback_html = self._fetch_html(abroad_url)
-            fallback_soup = BeautifulSoup(fallback_html, "lxml")
-            fallback_rows = self._extract_cart_items(fallback_soup, bet_type)
+        if fallback_html is not None:
+            fallback_rows = self._extract_cart_items_from_html(fallback_html.result(), bet_type)
             if fallback_rows:
                 urls[f"{bet_type}_fallback"] = abroad_url
                 return fallback_rows, urls
@@ -396,6 +583,7 @@ class NetkeibaScraper:
         return f"https://race.netkeiba.com/odds/abroad.html?race_id={race_id}"
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def _build_odds_type_url(race_id: str | None, bet_type: str) -> str | None:
         if not race_id:
             return None
@@ -405,6 +593,7 @@ class NetkeibaScraper:
         return f"https://race.netkeiba.com/odds/index.html?type={odds_type}&race_id={race_id}"
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def _build_abroad_type_url(race_id: str | None, bet_type: str) -> str | None:
         if not race_id:
             return None
@@ -419,108 +608,146 @@ class NetkeibaScraper:
         bet_type: str,
         entries: list[dict[str, str]],
     ) -> tuple[list[dict[str, str]], dict[str, str]]:
-        html = self._fetch_html(abroad_url)
-        soup = BeautifulSoup(html, "lxml")
-
-        jiku_values = self._extract_jiku_values(soup)
+        page = self._parse_odds_page(self._fetch_html(abroad_url))
+        jiku_values = self._extract_jiku_values(page)
+        page_cells: list[tuple[str, str]] = []
         if not jiku_values:
+            # Without a jiku selector the page may list combinations itself;
+            # keep them as a baseline that the per-jiku pages then override.
+            page_cells = self._extract_cart_cells(page)
             jiku_values = self._extract_horse_numbers_from_entries(entries)
 
-        all_rows: dict[str, dict[str, str]] = {}
         jiku_urls: dict[str, str] = {}
-
         for jiku in jiku_values:
-            jiku_url = f"{abroad_url}&jiku={jiku}"
-            jiku_urls[f"{bet_type}_jiku_{jiku}"] = jiku_url
-            jiku_html = self._fetch_html(jiku_url)
-            jiku_soup = BeautifulSoup(jiku_html, "lxml")
-            for row in self._extract_cart_items(jiku_soup, bet_type, include_key=True):
-                row_key = row.pop("_cart_item", "")
-                if not row_key:
-                    continue
-                all_rows[row_key] = row
+            jiku_urls[f"{bet_type}_jiku_{jiku}"] = f"{abroad_url}&jiku={jiku}"
 
-        rows = list(all_rows.values())
-        rows.sort(key=lambda row: self._combo_sort_key(row.get("組み合わせ", "")))
+        jiku_cells = self._fetch_many(
+            list(jiku_urls.values()),
+            self._stream_cart_cells,
+            max_workers=self.options.jiku_workers,
+        )
+        # Cells of every jiku page go through one dedup-and-sort pass keyed by
+        # cart item, instead of sorting each page and merging afterwards.
+        rows = self._build_cart_rows(
+            [cell for cells in [page_cells, *jiku_cells] for cell in cells],
+            bet_type,
+            include_key=True,
+        )
+        for row in rows:
+            del row["_cart_item"]
         return rows, jiku_urls
 
     @staticmethod
-    def _extract_jiku_values(soup: BeautifulSoup) -> list[str]:
+    def _extract_jiku_values(page: Any) -> list[str]:
+        if HTMLParser is not None:
+            options = [node.attributes for node in page.css("option[value]")]
+        else:
+            options = [node.attrib for node in page.iterfind(".//option[@value]")]
         values: list[str] = []
-        for option in soup.select("option[value]"):
-            value = option.get("value", "").strip()
-            if value.isdigit() and value not in values:
+        seen: set[str] = set()
+        for attributes in options:
+            value = (attributes.get("value") or "").strip()
+            if value.isdigit() and value not in seen:
+                seen.add(value)
                 values.append(value)
         return values
 
     @staticmethod
     def _extract_horse_numbers_from_entries(entries: list[dict[str, str]]) -> list[str]:
         values: list[str] = []
+        seen: set[str] = set()
+        key_map = NetkeibaScraper._build_normalized_key_map(entries)
         for row in entries:
-            value = NetkeibaScraper._extract_horse_number_from_entry_row(row)
-            if value.isdigit() and value not in values:
+            value = NetkeibaScraper._extract_horse_number_and_name_from_entry_row(row, key_map)[0]
+            if value.isdigit() and value not in seen:
+                seen.add(value)
                 values.append(value)
         return values
 
     @staticmethod
-    def _extract_horse_number_from_entry_row(row: dict[str, str]) -> str:
-        normalized = {key.replace(" ", ""): str(value).strip() for key, value in row.items()}
-        for key in ["馬番", "col_2", "col_1"]:
-            value = normalized.get(key, "")
-            if value.isdigit():
-                return str(int(value))
-        return ""
+    def _build_horse_lookup(entries: list[dict[str, str]]) -> dict[str, str]:
+        horse_name_by_no: dict[str, str] = {}
+        key_map = NetkeibaScraper._build_normalized_key_map(entries)
+        for row in entries:
+            no, name = NetkeibaScraper._extract_horse_number_and_name_from_entry_row(row, key_map)
+            if no.isdigit():
+                horse_name_by_no[no] = name
+        return horse_name_by_no
 
     @staticmethod
-    def _extract_horse_name_from_entry_row(row: dict[str, str]) -> str:
-        normalized = {key.replace(" ", ""): str(value).strip() for key, value in row.items()}
+    def _extract_horse_number_and_name_from_entry_row(
+        row: dict[str, str],
+        key_map: dict[str, str] | None = None,
+    ) -> tuple[str, str]:
+        # Only the few candidate columns are looked up, through the shared
+        # space-stripped key map, instead of normalizing every cell per row.
+        if key_map is None:
+            key_map = NetkeibaScraper._build_normalized_key_map([row])
+        get = NetkeibaScraper._get_by_normalized_key
+        number = ""
+        for key in ["馬番", "col_2", "col_1"]:
+            value = str(get(row, key_map, key)).strip()
+            if value.isdigit():
+                number = str(int(value))
+                break
+        name = ""
         for key in ["馬名", "col_4", "col_3"]:
-            value = normalized.get(key, "")
+            value = str(get(row, key_map, key)).strip()
             if value:
-                return value
-        return ""
+                name = value
+                break
+        return number, name
 
-    def _extract_cart_items(
+    def _extract_cart_items_from_html(
         self,
-        soup: BeautifulSoup,
+        html: str,
         bet_type: str,
         include_key: bool = False,
     ) -> list[dict[str, str]]:
-        expected_count = 2 if bet_type in {"枠連", "馬連", "ワイド", "馬単"} else 3
-        rows: list[dict[str, str]] = []
+        return self._build_cart_rows(self._extract_cart_cells(self._parse_odds_page(html)), bet_type, include_key)
 
-        for cell in soup.select("td[cart-item]"):
-            cart_item = cell.get("cart-item", "")
-            numbers = re.findall(r"_(\d+)", cart_item)
+    def _extract_cart_cells(self, page: Any) -> list[tuple[str, str]]:
+        if HTMLParser is None:
+            return [self._read_cart_cell(cell) for cell in page.iterfind(".//td[@cart-item]")]
+        return [self._read_selectolax_cart_cell(cell) for cell in page.css("td[cart-item]")]
+
+    def _build_cart_rows(
+        self,
+        cells: list[tuple[str, str]],
+        bet_type: str,
+        include_key: bool,
+    ) -> list[dict[str, str]]:
+        expected_count = 2 if bet_type in {"枠連", "馬連", "ワイド", "馬単"} else 3
+        dedup: dict[str, dict[str, str]] = {}
+        # Bind the compiled pattern's method once; this loop runs per cell.
+        find_numbers = CART_ITEM_NUMBER_RE.findall
+
+        for cart_item, odds in cells:
+            # Well-formed items ("b8_01_02_03") split into digit-only parts
+            # faster than the regex can scan them; anything else takes the
+            # regex, so the result always matches findall(r"_(\d+)").
+            parts = cart_item.split("_")[1:]
+            if "" not in parts and "".join(parts).isdecimal():
+                numbers = parts
+            else:
+                numbers = find_numbers(cart_item)
             combo_numbers = numbers[-expected_count:]
             if len(combo_numbers) != expected_count:
                 continue
 
-            odds_node = cell.select_one("span#odds")
-            odds = (
-                odds_node.get_text(" ", strip=True)
-                if odds_node
-                else " ".join(cell.get_text(" ", strip=True).split())
-            )
-
+            combo = "-".join(combo_numbers)
             row = {
-                "組み合わせ": "-".join(combo_numbers),
+                "組み合わせ": combo,
                 "オッズ": self._normalize_odds_value(odds),
             }
             if include_key:
                 row["_cart_item"] = cart_item
-            rows.append(row)
-
-        dedup: dict[str, dict[str, str]] = {}
-        for row in rows:
-            key = row.get("_cart_item") or row["組み合わせ"]
-            dedup[key] = row
+            dedup[(include_key and cart_item) or combo] = row
 
-        merged = list(dedup.values())
-        merged.sort(key=lambda row: self._combo_sort_key(row.get("組み合わせ", "")))
-        return merged
+        return sorted(dedup.values(), key=lambda row: self._combo_sort_key(row.get("組み合わせ", "")))
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def _combo_sort_key(combo: str) -> tuple[int, ...]:
         values = [int(x) for x in combo.split("-") if x.isdigit()]
         return tuple(values)
@@ -529,11 +756,137 @@ class NetkeibaScraper:
     def _normalize_odds_value(value: str) -> str:
         return value.replace(",", "").strip()
 
+    def _fetch_many(
+        self,
+        urls: list[str],
+        fetch: Callable[[str], _T],
+        max_workers: int | None = None,
+    ) -> list[_T]:
+        if len(urls) <= 1:
+            return [fetch(url) for url in urls]
+        workers = min(max_workers or self.options.max_workers, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch, urls))
+
+    def _fetch_speculatively(self, url: str) -> Future[str]:
+        executor = self._speculative_executor
+        if executor is not None:
+            return executor.submit(self._fetch_html, url)
+        # Outside scrape() there is no pool to join, so fetch up front.
+        future: Future[str] = Future()
+        try:
+            future.set_result(self._fetch_html(url))
+        except Exception as exc:  # noqa: BLE001
+            future.set_exception(exc)
+        return future
+
+    def _stream_cart_cells(self, url: str) -> list[tuple[str, str]]:
+        # Jiku pages are the largest documents the scraper reads. Feed the
+        # body to lxml as it downloads and keep only the cart-item cells,
+        # instead of buffering the text and building a full tree.
+        cells: list[tuple[str, str]] = []
+        # The slot is held until the streamed body has been read.
+        with self._request_slots, self.session.get(url, timeout=self.options.timeout, stream=True) as response:
+            response.raise_for_status()
+            parser = etree.HTMLPullParser(events=("end",), tag="td", encoding=response.encoding)
+            for chunk in response.iter_content(chunk_size=1 << 16):
+                parser.feed(chunk)
+                self._collect_streamed_cart_cells(parser, cells)
+            try:
+                parser.close()
+            except etree.XMLSyntaxError:
+                pass
+            self._collect_streamed_cart_cells(parser, cells)
+        return cells
+
+    @staticmethod
+    def _collect_streamed_cart_cells(parser: etree.HTMLPullParser, cells: list[tuple[str, str]]) -> None:
+        for _, cell in parser.read_events():
+            if cell.get("cart-item") is not None:
+                cells.append(NetkeibaScraper._read_cart_cell(cell))
+            cell.clear(keep_tail=True)
+
+    @staticmethod
+    def _read_cart_cell(cell: etree._Element) -> tuple[str, str]:
+        odds_node = next(cell.iterfind(".//span[@id='odds']"), None)
+        texts = (odds_node if odds_node is not None else cell).itertext()
+        return cell.get("cart-item", ""), NetkeibaScraper._join_cart_texts(texts, odds_node is not None)
+
+    @staticmethod
+    def _read_selectolax_cart_cell(cell: Any) -> tuple[str, str]:
+        # Node.text(strip=True) joins whitespace-only nodes too, so gather the
+        # raw text nodes and join them exactly as the lxml reader does.
+        odds_node = cell.css_first("span#odds")
+        texts = NetkeibaScraper._iter_selectolax_texts(odds_node if odds_node is not None else cell)
+        return cell.attributes.get("cart-item") or "", NetkeibaScraper._join_cart_texts(texts, odds_node is not None)
+
+    @staticmethod
+    def _iter_selectolax_texts(node: Any) -> Iterator[str]:
+        # Walk children explicitly: the Modest backend's traverse() runs on
+        # past the node into its following siblings.
+        for child in node.iter(include_text=True):
+            if child.tag == "-text":
+                yield child.text_content or ""
+            else:
+                yield from NetkeibaScraper._iter_selectolax_texts(child)
+
+    @staticmethod
+    def _join_cart_texts(texts: Iterable[str], from_odds_node: bool) -> str:
+        if from_odds_node:
+            return " ".join(text.strip() for text in texts if text.strip())
+        return " ".join(" ".join(texts).split())
+
+    @staticmethod
+    def _parse_odds_page(html: str) -> Any:
+        # Odds pages can hold thousands of cart-item cells; selectolax walks
+        # them fastest when installed, otherwise lxml's C-level tree search
+        # is used rather than BeautifulSoup selectors. The parsed page is
+        # handed to _extract_cart_cells / _extract_jiku_values.
+        if HTMLParser is not None:
+            return HTMLParser(html)
+        return NetkeibaScraper._parse_lxml(html)
+
+    @staticmethod
+    def _parse_lxml(html: str) -> etree._Element:
+        try:
+            try:
+                return lxml_html.fromstring(html)
+            except ValueError:
+                # lxml rejects str input that carries an XML encoding declaration.
+                return lxml_html.fromstring(html.encode("utf-8"))
+        except etree.ParserError:
+            # Empty or comment-only bodies have no root element.
+            return lxml_html.fromstring("<html></html>")
+
     def _fetch_html(self, url: str) -> str:
-        response = self.session.get(url, timeout=self.options.timeout)
+        with self._html_cache_lock:
+            future = self._html_cache.get(url)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._html_cache[url] = future
+        if not is_owner:
+            return future.result()
+        try:
+            html = self._download_html(url)
+        except BaseException as exc:
+            # Failures are not memoized; a later call retries the request.
+            with self._html_cache_lock:
+                self._html_cache.pop(url, None)
+            future.set_exception(exc)
+            raise
+        future.set_result(html)
+        return html
+
+    def _download_html(self, url: str) -> str:
+        with self._request_slots:
+            response = self.session.get(url, timeout=self.options.timeout)
         response.raise_for_status()
         if not response.encoding:
-            response.encoding = response.apparent_encoding
+            # Read the declared charset from the page head instead of running
+            # charset detection over the whole body; netkeiba defaults to EUC-JP.
+            match = META_CHARSET_RE.search(response.content, 0, 4096)
+            response.encoding = match.group(1).decode("ascii") if match else "EUC-JP"
         return response.text
 
     @staticmethod
@@ -543,24 +896,51 @@ class NetkeibaScraper:
         return race_id
 
     @staticmethod
-    def _extract_race_name(soup: BeautifulSoup) -> str | None:
-        candidates = [
-            soup.select_one("h1"),
-            soup.select_one(".RaceName"),
-            soup.select_one(".RaceData01"),
-            soup.select_one("title"),
-        ]
+    def _pick_race_name(candidates: list[Any]) -> str | None:
         for item in candidates:
             if item and item.get_text(strip=True):
                 return item.get_text(" ", strip=True)
         return None
 
-    def _extract_race_entries(self, soup: BeautifulSoup) -> list[dict[str, str]]:
-        table = self._find_table_by_keywords(soup, ["馬名"]) or self._find_largest_table(soup)
+    def _extract_entries_from_tables(self, tables: list[Any]) -> list[dict[str, str]]:
+        table = self._find_table_by_keywords(tables, ["馬名"]) or self._find_largest_table(tables)
         if table is None:
             return []
         return self._parse_table(table)
 
+    def _analyze_index_soup(
+        self,
+        soup: BeautifulSoup,
+        base_url: str,
+    ) -> tuple[str | None, list[dict[str, str]], dict[str, str]]:
+        # Collect everything the race page is mined for in one walk over the
+        # tree, instead of separate select() passes for the name, the entry
+        # table and the odds links.
+        first: dict[str, Any] = {}
+        tables: list[Any] = []
+        anchors: list[Any] = []
+        for tag in soup.find_all(True):
+            classes = tag.get("class") or ()
+            if "RaceName" in classes:
+                first.setdefault("RaceName", tag)
+            if "RaceData01" in classes:
+                first.setdefault("RaceData01", tag)
+            name = tag.name
+            if name == "table":
+                tables.append(tag)
+            elif name == "a":
+                if tag.has_attr("href"):
+                    anchors.append(tag)
+            elif name in {"h1", "title"}:
+                first.setdefault(name, tag)
+
+        race_name = self._pick_race_name(
+            [first.get("h1"), first.get("RaceName"), first.get("RaceData01"), first.get("title")]
+        )
+        entries = self._extract_entries_from_tables(tables)
+        odds_links = self._build_odds_links(anchors, base_url)
+        return race_name, entries, odds_links
+
     def _extract_odds_from_page(self, soup: BeautifulSoup) -> dict[str, Any]:
         result: dict[str, Any] = {}
         for table in soup.select("table"):
@@ -575,15 +955,24 @@ class NetkeibaScraper:
                 result[matched] = rows
         return result
 
-    def _extract_win_place_by_table_position(self, soup: BeautifulSoup) -> dict[str, list[dict[str, str]]]:
-        tables = soup.select("table")
+    def _extract_win_place_rows(self, html: str, bet_type: str) -> list[dict[str, str]]:
+        # Headings and tables are gathered in one walk and shared by the
+        # heading-based extraction and the table-position fallback.
+        nodes = BeautifulSoup(html, "lxml").find_all(["h1", "h2", "h3", "h4", "table"])
+        rows = self._extract_odds_from_nodes(nodes).get(bet_type, [])
+        if rows:
+            return rows
+        tables = [node for node in nodes if node.name == "table"]
+        return self._extract_win_place_from_tables(tables).get(bet_type, [])
+
+    def _extract_win_place_from_tables(self, tables: list[Any]) -> dict[str, list[dict[str, str]]]:
         if len(tables) < 2:
             return {"単勝": [], "複勝": []}
 
         def parse_table(table_tag: Any) -> list[dict[str, str]]:
             rows: list[dict[str, str]] = []
-            for tr in table_tag.select("tr"):
-                cells = [td.get_text(" ", strip=True) for td in tr.select("td")]
+            for tr in table_tag.find_all("tr"):
+                cells = [td.get_text(" ", strip=True) for td in tr.find_all("td")]
                 if len(cells) < 3:
                     continue
                 horse_no = cells[1].strip() if len(cells) > 1 else ""
@@ -607,44 +996,49 @@ class NetkeibaScraper:
             "複勝": parse_table(tables[1]),
         }
 
-    def _extract_odds_by_bet_type(self, soup: BeautifulSoup) -> dict[str, list[dict[str, str]]]:
+    def _extract_odds_from_nodes(self, nodes: list[Any]) -> dict[str, list[dict[str, str]]]:
         result: dict[str, list[dict[str, str]]] = {bet_type: [] for bet_type in BET_TYPES}
 
-        for heading in soup.select("h1, h2, h3, h4"):
-            title = heading.get_text(" ", strip=True)
-            normalized_title = title.replace("３", "3")
-
-            table = heading.find_next("table")
-            if not table:
+        # Walk headings and tables once in document order; each heading is
+        # paired with the first table after it, as find_next("table") would.
+        pending_titles: list[str] = []
+        for node in nodes:
+            if node.name != "table":
+                title = node.get_text(" ", strip=True)
+                pending_titles.append(title.replace("３", "3"))
                 continue
-            rows = self._parse_table(table)
+            if not pending_titles:
+                continue
+            titles, pending_titles = pending_titles, []
+            rows = self._parse_table(node)
             if not rows:
                 continue
 
-            if "単勝" in normalized_title and "複勝" in normalized_title:
-                tansho_rows, fukusho_rows = self._split_tansho_fukusho(rows)
-                if tansho_rows:
-                    result["単勝"] = tansho_rows
-                if fukusho_rows:
-                    result["複勝"] = fukusho_rows
-                continue
+            for normalized_title in titles:
+                if "単勝" in normalized_title and "複勝" in normalized_title:
+                    tansho_rows, fukusho_rows = self._split_tansho_fukusho(rows)
+                    if tansho_rows:
+                        result["単勝"] = tansho_rows
+                    if fukusho_rows:
+                        result["複勝"] = fukusho_rows
+                    continue
 
-            if "馬連" in normalized_title and "ワイド" in normalized_title:
-                umaren_rows, wide_rows = self._split_umaren_wide(rows)
-                if umaren_rows:
-                    result["馬連"] = umaren_rows
-                if wide_rows:
-                    result["ワイド"] = wide_rows
-                continue
+                if "馬連" in normalized_title and "ワイド" in normalized_title:
+                    umaren_rows, wide_rows = self._split_umaren_wide(rows)
+                    if umaren_rows:
+                        result["馬連"] = umaren_rows
+                    if wide_rows:
+                        result["ワイド"] = wide_rows
+                    continue
 
-            if "枠連" in normalized_title:
-                result["枠連"] = rows
-            elif "馬単" in normalized_title:
-                result["馬単"] = rows
-            elif "3連複" in normalized_title:
-                result["三連複"] = rows
-            elif "3連単" in normalized_title:
-                result["三連単"] = rows
+                if "枠連" in normalized_title:
+                    result["枠連"] = rows
+                elif "馬単" in normalized_title:
+                    result["馬単"] = rows
+                elif "3連複" in normalized_title:
+                    result["三連複"] = rows
+                elif "3連単" in normalized_title:
+                    result["三連単"] = rows
 
         return result
 
@@ -653,17 +1047,18 @@ class NetkeibaScraper:
         tansho_rows: list[dict[str, str]] = []
         fukusho_rows: list[dict[str, str]] = []
 
+        key_map = NetkeibaScraper._build_normalized_key_map(rows)
+        get = NetkeibaScraper._get_by_normalized_key
         for row in rows:
-            normalized = {key.replace(" ", ""): value for key, value in row.items()}
             base = {
-                "人気": normalized.get("人気", ""),
-                "ゲート": normalized.get("ゲート", ""),
-                "馬番": normalized.get("馬番", ""),
-                "馬名": normalized.get("馬名", ""),
+                "人気": get(row, key_map, "人気"),
+                "ゲート": get(row, key_map, "ゲート"),
+                "馬番": get(row, key_map, "馬番"),
+                "馬名": get(row, key_map, "馬名"),
             }
 
-            tansho_value = normalized.get("単勝オッズ", normalized.get("単勝", ""))
-            fukusho_value = normalized.get("複勝オッズ", normalized.get("複勝", ""))
+            tansho_value = get(row, key_map, "単勝オッズ", "単勝")
+            fukusho_value = get(row, key_map, "複勝オッズ", "複勝")
 
             tansho_rows.append({**base, "オッズ": NetkeibaScraper._normalize_odds_value(tansho_value)})
             fukusho_rows.append({**base, "オッズ": NetkeibaScraper._normalize_odds_value(fukusho_value)})
@@ -675,12 +1070,13 @@ class NetkeibaScraper:
         umaren_rows: list[dict[str, str]] = []
         wide_rows: list[dict[str, str]] = []
 
+        key_map = NetkeibaScraper._build_normalized_key_map(rows)
+        get = NetkeibaScraper._get_by_normalized_key
         for row in rows:
-            normalized = {key.replace(" ", ""): value for key, value in row.items()}
-            pair = normalized.get("組み合わせ", normalized.get("組合せ", ""))
-            popularity = normalized.get("人気", "")
-            umaren_odds = normalized.get("オッズ", "")
-            wide_odds = normalized.get("ワイド・オッズ", normalized.get("ワイド", ""))
+            pair = get(row, key_map, "組み合わせ", "組合せ")
+            popularity = get(row, key_map, "人気")
+            umaren_odds = get(row, key_map, "オッズ")
+            wide_odds = get(row, key_map, "ワイド・オッズ", "ワイド")
 
             umaren_rows.append(
                 {
@@ -699,20 +1095,50 @@ class NetkeibaScraper:
 
         return umaren_rows, wide_rows
 
-    def _discover_odds_links(self, soup: BeautifulSoup, base_url: str) -> dict[str, str]:
+    @staticmethod
+    def _build_normalized_key_map(rows: list[dict[str, str]]) -> dict[str, str]:
+        # Rows of one table share their header keys, so the space-stripped
+        # lookup names are computed once for the table instead of per row.
+        key_map: dict[str, str] = {}
+        for row in rows:
+            for key in row:
+                key_map[key.replace(" ", "")] = key
+        return key_map
+
+    @staticmethod
+    def _get_by_normalized_key(row: dict[str, str], key_map: dict[str, str], *names: str) -> str:
+        for name in names:
+            key = key_map.get(name)
+            if key is not None and key in row:
+                return row[key]
+        return ""
+
+    @staticmethod
+    def _build_odds_links(anchors: list[Any], base_url: str) -> dict[str, str]:
         links: dict[str, str] = {}
-        for anchor in soup.select("a[href]"):
+        for anchor in anchors:
             text = anchor.get_text(" ", strip=True)
             href = anchor.get("href", "")
             if not text and not href:
                 continue
+            # Most anchors name no bet type; one regex scan rules them out
+            # before checking each bet type individually.
+            if not BET_TYPE_RE.search(text) and not BET_TYPE_RE.search(href):
+                continue
+            # Absolute hrefs resolve to themselves unless they hold dot
+            # segments, so only relative links need urljoin's re-parsing.
+            if href.startswith(("https://", "http://")) and "/." not in href:
+                full_url = href
+            else:
+                full_url = urljoin(base_url, href)
             for bet_type in BET_TYPES:
                 if bet_type in text or bet_type in href:
-                    links[bet_type] = urljoin(base_url, href)
+                    links[bet_type] = full_url
         return links
 
     def _extract_best_table(self, soup: BeautifulSoup) -> list[dict[str, str]]:
-        odds_table = self._find_table_by_keywords(soup, ["オッズ"]) or self._find_largest_table(soup)
+        tables = soup.select("table")
+        odds_table = self._find_table_by_keywords(tables, ["オッズ"]) or self._find_largest_table(tables)
         if odds_table is None:
             return []
         return self._parse_table(odds_table)
@@ -731,40 +1157,63 @@ class NetkeibaScraper:
         return ""
 
     @staticmethod
-    def _find_largest_table(soup: BeautifulSoup):
-        tables = soup.select("table")
+    def _find_largest_table(tables: list[Any]):
         if not tables:
             return None
-        return max(tables, key=lambda t: len(t.select("tr")))
+        return max(tables, key=lambda t: len(t.find_all("tr")))
 
     @staticmethod
-    def _find_table_by_keywords(soup: BeautifulSoup, keywords: list[str]):
-        for table in soup.select("table"):
-            text = table.get_text(" ", strip=True)
-            if all(keyword in text for keyword in keywords):
-                return table
+    def _find_table_by_keywords(tables: list[Any], keywords: list[str]):
+        # Keywords without whitespace can only match inside a single text node
+        # of the space-joined get_text(), so scan the nodes lazily and stop as
+        # soon as every keyword has been seen.
+        if not keywords or any(not keyword or any(ch.isspace() for ch in keyword) for keyword in keywords):
+            for table in tables:
+                text = table.get_text(" ", strip=True)
+                if all(keyword in text for keyword in keywords):
+                    return table
+            return None
+
+        for table in tables:
+            remaining = set(keywords)
+            for text in table.strings:
+                remaining = {keyword for keyword in remaining if keyword not in text}
+                if not remaining:
+                    return table
         return None
 
     @staticmethod
     def _parse_table(table_tag: Any) -> list[dict[str, str]]:
-        rows = table_tag.select("tr")
+        # Plain tag-name lookups go through find_all() rather than select():
+        # they match the same nodes in document order without compiling and
+        # evaluating a CSS selector for every row.
+        rows = table_tag.find_all("tr")
         if not rows:
             return []
 
-        headers = [th.get_text(" ", strip=True) for th in rows[0].select("th")]
+        # Header strings become the keys of every row dict; intern them so rows
+        # share one key object and downstream hashing/compares stay cheap.
+        headers = [sys.intern(th.get_text(" ", strip=True)) for th in rows[0].find_all("th")]
         if not headers:
             thead = table_tag.select_one("thead tr")
             if thead:
-                headers = [th.get_text(" ", strip=True) for th in thead.select("th")]
+                headers = [sys.intern(th.get_text(" ", strip=True)) for th in thead.find_all("th")]
 
         data: list[dict[str, str]] = []
         for row in rows[1:]:
-            cells = row.select("td")
+            cells = row.find_all("td")
             if not cells:
                 continue
             values = [cell.get_text(" ", strip=True) for cell in cells]
             if headers and len(headers) == len(values):
                 data.append(dict(zip(headers, values, strict=False)))
             else:
-                data.append({f"col_{idx + 1}": value for idx, value in enumerate(values)})
+                data.append(dict(zip(NetkeibaScraper._positional_keys(len(values)), values)))
         return data
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _positional_keys(count: int) -> tuple[str, ...]:
+        # Header-less rows are keyed col_1..col_N; build each width's key
+        # tuple once instead of formatting and interning names per cell.
+        return tuple(sys.intern(f"col_{idx + 1}") for idx in range(count))